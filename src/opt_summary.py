@@ -55,11 +55,13 @@ class OptSummary(DeletionSummary):
 
         for b_prime in range(1, self.beta):
             for p in range(1, len(self.f)):
+                if self.method == 'arb':
+                    # the 'arb' update fills every k_prime <= k of the cell at once
+                    self.arbUpdateMatrix(p, k, b_prime)
+                    continue
                 for k_prime in range(k + 1):
                     if self.method == 'con':
                         self.conUpdateMatrix(p, k_prime, b_prime)
-                    elif self.method == 'arb':
-                        self.arbUpdateMatrix(p, k_prime, b_prime)
                     else:
                         print("Wrong method provided.")
                         return -1
@@ -70,23 +72,29 @@ class OptSummary(DeletionSummary):
     def arbUpdateMatrix(self, p, k, b):
         # Sub procedure used to update the error matrix M.
         # Implemented according to Figure 5 in the paper.
+        # Updates M[p, b, k_prime] for every k_prime in [0, k].
+        # The inner loops over q and k_prime of the paper are a min-plus convolution
+        # along the deletions axis, evaluated here with numpy one k_prime shift at a time
+        # so the temporaries stay of size p x (k + 1).
         # p = int, index of the self.values and self.f arrays (frequency vector)
         # b = int, bucket
-        # k = int, number of deletions
+        # k = int, max number of deletions
 
-        if self.f[p] <= k:
-            self.M[p, b, k] = self.M[p - 1, b, k-self.f[p]]
-        else:
-            self.M[p, b, k] = float(np.inf)
-        for q in range(p):
-            for k_prime in range(k + 1):
-                e = self.M[q, b - 1, k - k_prime]
-                e_prime = self.lme[q + 1, p, k_prime]
-                self.M[p, b, k] = np.fmin(self.M[p, b, k], e + e_prime)
+        ks = np.arange(k + 1)
+        self.M[p, b, :k + 1] = float(np.inf)
+        fits = self.f[p] <= ks
+        self.M[p, b, ks[fits]] = self.M[p - 1, b, ks[fits] - self.f[p]]
+
+        prev = self.M[:p, b - 1, :k + 1] # M[q, b - 1, .] for every q < p
+        lme = self.lme[1:p + 1, p, :k + 1] # lme[q + 1, p, .] for every q < p
+        best = self.M[p, b, :k + 1]
+        for k_prime in range(k + 1):
+            e = np.min(prev[:, :k + 1 - k_prime] + lme[:, k_prime, None], axis=0)
+            best[k_prime:] = np.fmin(best[k_prime:], e)
 
 
     @staticmethod
-    @njit
+    @njit(cache=True)
     def conUpdateMatrix_(M, p, k, b, f, sqerror, L , R):
         # a static helper function that is called instead of conUpdateMatrix
         # when self.jit = True, to test the speedup
@@ -191,3 +199,15 @@ class OptSummary(DeletionSummary):
                 for h in range(self.k + 1):
                     self.lme[i, j, h] = self.lowerMaxErr(i, j, h)
         return
+
+
+def warmup():
+    # Compile (or load from the on-disk cache) the numba kernels of this module
+    # on a tiny input, so that the first real summary does not pay for it.
+    # Call it once at the start of a worker process.
+
+    values = np.arange(3)
+    f = np.ones(3, dtype=np.int64)
+    summary = OptSummary(values, f, 2, 1)
+    summary.jit = True
+    summary.summarize(1)
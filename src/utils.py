@@ -1,6 +1,10 @@
+import os
+import subprocess
+import sys
 import numpy as np
-from matplotlib import pyplot as plt
-from sklearn.neighbors import LocalOutlierFactor
+
+# matplotlib and scikit-learn are imported inside the functions that need them
+# so that importing the data helpers stays cheap.
 
 
 def generate_norm_data(low, high, var=0.25, size=50_000):
@@ -54,6 +58,8 @@ def plot_histogram(left, right, n):
     # left = values that represent the left edges of the buckets (ascending order)
     # right = values that represent the right edges of the buckets (ascending order)
     # n = number of elements in each respective bucket
+    from matplotlib import pyplot as plt
+
     buckets = []
     widths = []
     for i in range(len(left)):
@@ -90,6 +96,8 @@ def outlier_removal(values, f, cont=0.02):
     # frac = float between 0. and 1.
     # Return: two arrays (values, f) that represent the frequency vector of the sample.
 
+    from sklearn.neighbors import LocalOutlierFactor
+
     data = np.repeat(values, f)
     clf = LocalOutlierFactor(contamination=0.02)
     res = clf.fit_predict(data.reshape(-1, 1))
@@ -98,4 +106,23 @@ def outlier_removal(values, f, cont=0.02):
     return values, f
 
 
-
+def measure_startup_time(modules=('opt_summary',), warmup=True):
+    # Measure the startup cost of a fresh python process, as paid by short-lived workers.
+    # modules = names of the modules in src/ to import
+    # warmup = bool, if True also call opt_summary.warmup() after the imports
+    # Returns: dict with the import time and warm-up time in seconds.
+
+    code = (
+        "import time\n"
+        "t = time.perf_counter()\n"
+        f"for m in {list(modules)!r}: __import__(m)\n"
+        "t_import = time.perf_counter() - t\n"
+        "t = time.perf_counter()\n"
+        f"if {warmup!r}: __import__('opt_summary').warmup()\n"
+        "print(t_import, time.perf_counter() - t)\n"
+    )
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    out = subprocess.run([sys.executable, '-c', code], cwd=src_dir,
+                         capture_output=True, text=True, check=True).stdout
+    t_import, t_warmup = map(float, out.split())
+    return {'import': t_import, 'warmup': t_warmup}